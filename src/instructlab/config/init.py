@@ -1,18 +1,31 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # Standard
-from os import listdir
+from os import scandir
 from os.path import basename, dirname, exists, splitext
+import subprocess
 
 # Third Party
-from git import GitError, Repo
 import click
 
 # First Party
-from instructlab import configuration as config
+from instructlab import config_defaults as defaults
 from instructlab import utils
 
 
+def _prompt(text, default):
+    """Ask for a value on stdin, falling back to ``default`` on empty input.
+
+    A plain ``input()`` is enough for these one-line questions and avoids
+    click's termui machinery; EOF or Ctrl-C aborts like ``click.prompt``.
+    """
+    try:
+        resp = input(f"{text} [{default}]: ").strip()
+    except (EOFError, KeyboardInterrupt) as exc:
+        raise click.Abort() from exc
+    return resp or default
+
+
 @click.command()
 @click.option(
     "--interactive/--non-interactive",
@@ -23,26 +36,26 @@ from instructlab import utils
 @click.option(
     "--model-path",
     type=click.Path(),
-    default=config.DEFAULT_MODEL_PATH,
+    default=defaults.DEFAULT_MODEL_PATH,
     show_default=True,
     help="Path to the model used during generation.",
 )
 @click.option(
     "--taxonomy-base",
-    default=config.DEFAULT_TAXONOMY_BASE,
+    default=defaults.DEFAULT_TAXONOMY_BASE,
     show_default=True,
     help="Base git-ref to use when listing/generating new taxonomy.",
 )
 @click.option(
     "--taxonomy-path",
     type=click.Path(),
-    default=config.DEFAULT_TAXONOMY_PATH,
+    default=defaults.DEFAULT_TAXONOMY_PATH,
     show_default=True,
-    help=f"Path to {config.DEFAULT_TAXONOMY_REPO} clone.",
+    help=defaults.HELP_TAXONOMY_PATH,
 )
 @click.option(
     "--repository",
-    default=config.DEFAULT_TAXONOMY_REPO,
+    default=defaults.DEFAULT_TAXONOMY_REPO,
     show_default=True,
     help="Taxonomy repository location.",
 )
@@ -66,9 +79,9 @@ def init(
     """Initializes environment for InstructLab"""
     clone_taxonomy_repo = True
     if interactive:
-        if exists(config.DEFAULT_CONFIG):
+        if exists(defaults.DEFAULT_CONFIG):
             overwrite = click.confirm(
-                f"Found {config.DEFAULT_CONFIG} in the current directory, do you still want to continue?"
+                f"Found {defaults.DEFAULT_CONFIG} in the current directory, do you still want to continue?"
             )
             if not overwrite:
                 return
@@ -80,14 +93,17 @@ def init(
             "environment [press Enter for defaults]:"
         )
         taxonomy_path = utils.expand_path(
-            click.prompt("Path to taxonomy repo", default=taxonomy_path)
+            _prompt("Path to taxonomy repo", taxonomy_path)
         )
 
+    # scandir stops at the first entry instead of materializing the whole
+    # directory listing; we only need to know whether the directory is empty
     try:
-        taxonomy_contents = listdir(taxonomy_path)
+        with scandir(taxonomy_path) as taxonomy_dir:
+            taxonomy_empty = next(taxonomy_dir, None) is None
     except FileNotFoundError:
-        taxonomy_contents = []
-    if taxonomy_contents:
+        taxonomy_empty = True
+    if not taxonomy_empty:
         clone_taxonomy_repo = False
     elif interactive:
         clone_taxonomy_repo = click.confirm(
@@ -97,27 +113,42 @@ def init(
     # clone taxonomy repo if it needs to be cloned
     if clone_taxonomy_repo:
         click.echo(f"Cloning {repository}...")
-        clone_depth = False if not min_taxonomy else 1
+        # invoke git directly instead of going through GitPython; the clone
+        # is a one-shot operation and the git binary streams the transfer
+        # without the GitPython process-wrapper overhead.
+        # blobless partial clone: full history stays available (so
+        # contributing back still works), but blobs are fetched on demand
+        # instead of all up front
+        clone_cmd = [
+            "git",
+            "clone",
+            "--branch",
+            "main",
+            "--recurse-submodules",
+            "--filter=blob:none",
+        ]
+        if min_taxonomy:
+            clone_cmd += ["--depth", "1"]
+        clone_cmd += [repository, taxonomy_path]
         try:
-            Repo.clone_from(
-                repository,
-                taxonomy_path,
-                branch="main",
-                recurse_submodules=True,
-                depth=clone_depth,
-            )
-        except GitError as exc:
-            click.secho(f"Failed to clone taxonomy repo: {exc}", fg="red")
+            subprocess.run(clone_cmd, check=True, capture_output=True, text=True)
+        except (subprocess.SubprocessError, OSError) as exc:
+            err = getattr(exc, "stderr", None)
+            err = err.strip() if isinstance(err, str) and err.strip() else exc
+            click.secho(f"Failed to clone taxonomy repo: {err}", fg="red")
             click.secho(f"Please make sure to manually run `git clone {repository}`")
             raise click.exceptions.Exit(1)
 
     # check if models dir exists, and if so ask for which model to use
     models_dir = dirname(model_path)
     if interactive and exists(models_dir):
-        model_path = utils.expand_path(
-            click.prompt("Path to your model", default=model_path)
-        )
-    click.echo(f"Generating `{config.DEFAULT_CONFIG}` in the current directory...")
+        model_path = utils.expand_path(_prompt("Path to your model", model_path))
+    # pylint: disable=C0415
+    # First Party
+    # NOTE: the configuration module is imported lazily to speed up CLI startup time.
+    from instructlab import configuration as config
+
+    click.echo(f"Generating `{defaults.DEFAULT_CONFIG}` in the current directory...")
     cfg = config.get_default_config()
     if train_profile != None:
         cfg.train = config.read_train_profile(train_profile)
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Default values shared across the CLI.
+
+This module deliberately has no third-party imports so that click
+decorators can reference the constants without paying the import cost of
+the full configuration machinery (pydantic, httpx, training libraries).
+"""
+
+DEFAULT_API_KEY = "no_api_key"
+DEFAULT_CONFIG = "config.yaml"
+# TODO: Consolidate --model and --model-path into one --model-path flag since we always need a path now
+DEFAULT_MODEL_OLD = "merlinite-7b-lab-Q4_K_M"
+DEFAULT_MODEL = "models/merlinite-7b-lab-Q4_K_M.gguf"
+DEFAULT_MODEL_PATH = "models/merlinite-7b-lab-Q4_K_M.gguf"
+DEFAULT_MODEL_REPO = "instructlab/granite-7b-lab"
+DEFAULT_TAXONOMY_REPO = "https://github.com/instructlab/taxonomy.git"
+DEFAULT_TAXONOMY_PATH = "taxonomy"
+DEFAULT_TAXONOMY_BASE = "origin/main"
+MAX_CONTEXT_SIZE = 4096
+# TODO: these constants should be removed, they should not leak out
+DEFAULT_NUM_CPUS = 10
+DEFAULT_CHUNK_WORD_COUNT = 1000
+DEFAULT_NUM_INSTRUCTIONS = 100
+DEFAULT_PROMPT_FILE = "prompt.txt"
+DEFAULT_GENERATED_FILES_OUTPUT_DIR = "generated"
+# use spawn start method, fork is not thread-safe
+DEFAULT_MULTIPROCESSING_START_METHOD = "spawn"
+
+# When otherwise unknown, ilab uses this as the default family
+DEFAULT_MODEL_FAMILY = "merlinite"
+
+# Model families understood by ilab
+MODEL_FAMILIES = set(("merlinite", "mixtral"))
+
+# Map model names to their family
+MODEL_FAMILY_MAPPINGS = {
+    "granite": "merlinite",
+}
+
+DEFAULT_CKPT_DIR = "checkpoints"
+DEFAULT_OUT_DIR = "train-output"
+
+# Help strings interpolated once here at import time instead of being
+# re-formatted in every command module that mentions the taxonomy repo.
+HELP_TAXONOMY_PATH = f"Path to {DEFAULT_TAXONOMY_REPO} clone."
+HELP_TAXONOMY_PATH_OR_FILE = (
+    f"Path to {DEFAULT_TAXONOMY_REPO} clone or local file path."
+)
@@ -4,6 +4,7 @@
 from os import path
 from re import match
 from typing import Optional
+import json
 import os
 import sys
 
@@ -27,42 +28,36 @@ import httpx
 import yaml
 
 # Local
+# NOTE: the DEFAULT_* constants live in config_defaults so the CLI can
+# reference them without importing this (heavy) module. They are re-exported
+# here for backwards compatibility.
+# pylint: disable=unused-import
 from . import log
+from .config_defaults import (
+    DEFAULT_API_KEY,
+    DEFAULT_CHUNK_WORD_COUNT,
+    DEFAULT_CKPT_DIR,
+    DEFAULT_CONFIG,
+    DEFAULT_GENERATED_FILES_OUTPUT_DIR,
+    DEFAULT_MODEL,
+    DEFAULT_MODEL_FAMILY,
+    DEFAULT_MODEL_OLD,
+    DEFAULT_MODEL_PATH,
+    DEFAULT_MODEL_REPO,
+    DEFAULT_MULTIPROCESSING_START_METHOD,
+    DEFAULT_NUM_CPUS,
+    DEFAULT_NUM_INSTRUCTIONS,
+    DEFAULT_OUT_DIR,
+    DEFAULT_PROMPT_FILE,
+    DEFAULT_TAXONOMY_BASE,
+    DEFAULT_TAXONOMY_PATH,
+    DEFAULT_TAXONOMY_REPO,
+    MAX_CONTEXT_SIZE,
+    MODEL_FAMILIES,
+    MODEL_FAMILY_MAPPINGS,
+)
 
-DEFAULT_API_KEY = "no_api_key"
-DEFAULT_CONFIG = "config.yaml"
-# TODO: Consolidate --model and --model-path into one --model-path flag since we always need a path now
-DEFAULT_MODEL_OLD = "merlinite-7b-lab-Q4_K_M"
-DEFAULT_MODEL = "models/merlinite-7b-lab-Q4_K_M.gguf"
-DEFAULT_MODEL_PATH = "models/merlinite-7b-lab-Q4_K_M.gguf"
-DEFAULT_MODEL_REPO = "instructlab/granite-7b-lab"
-DEFAULT_TAXONOMY_REPO = "https://github.com/instructlab/taxonomy.git"
-DEFAULT_TAXONOMY_PATH = "taxonomy"
-DEFAULT_TAXONOMY_BASE = "origin/main"
-MAX_CONTEXT_SIZE = 4096
-# TODO: these constants should be removed, they should not leak out
-DEFAULT_NUM_CPUS = 10
-DEFAULT_CHUNK_WORD_COUNT = 1000
-DEFAULT_NUM_INSTRUCTIONS = 100
-DEFAULT_PROMPT_FILE = "prompt.txt"
-DEFAULT_GENERATED_FILES_OUTPUT_DIR = "generated"
 DEFAULT_CONNECTION_TIMEOUT = httpx.Timeout(timeout=30.0)
-# use spawn start method, fork is not thread-safe
-DEFAULT_MULTIPROCESSING_START_METHOD = "spawn"
-
-# When otherwise unknown, ilab uses this as the default family
-DEFAULT_MODEL_FAMILY = "merlinite"
-
-# Model families understood by ilab
-MODEL_FAMILIES = set(("merlinite", "mixtral"))
-
-# Map model names to their family
-MODEL_FAMILY_MAPPINGS = {
-    "granite": "merlinite",
-}
-
-DEFAULT_CKPT_DIR = "checkpoints"
-DEFAULT_OUT_DIR = "train-output"
 
 
 class ConfigException(Exception):
@@ -278,8 +273,10 @@ def get_dict(cfg):
 def write_config(cfg, config_file=DEFAULT_CONFIG):
     """Writes configuration to a disk"""
     with open(config_file, "w", encoding="utf-8") as yamlfile:
-        d = cfg.model_dump_json()
-        loaded = yaml.load(d, Loader=yaml.SafeLoader)
+        # model_dump_json emits plain JSON, so parse the intermediate
+        # representation with the JSON parser instead of the (much slower)
+        # YAML loader before serializing to YAML
+        loaded = json.loads(cfg.model_dump_json())
         yaml.dump(loaded, stream=yamlfile)
 
 
@@ -308,9 +305,12 @@ class Lab:
 
 
 def init(ctx, config_file):
+    # `--help`/`--version` never need a configuration file; bail out before
+    # reading and validating it so they return as quickly as possible
     if (
         ctx.invoked_subcommand not in {"config", "init", "sysinfo"}
         and "--help" not in sys.argv[1:]
+        and "--version" not in sys.argv[1:]
     ):
         if config_file == "DEFAULT":
             config_obj = get_default_config()
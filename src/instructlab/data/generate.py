@@ -8,7 +8,7 @@ import pathlib
 import click
 
 # First Party
-from instructlab import configuration as config
+from instructlab import config_defaults as defaults
 from instructlab import utils
 
 logger = logging.getLogger(__name__)
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 @click.command()
 @click.option(
     "--model",
-    default=config.DEFAULT_MODEL,
+    default=defaults.DEFAULT_MODEL,
     show_default=True,
     help="Name of the model used during generation.",
 )
@@ -25,40 +25,40 @@ logger = logging.getLogger(__name__)
     "--num-cpus",
     type=click.INT,
     help="Number of processes to use.",
-    default=config.DEFAULT_NUM_CPUS,
+    default=defaults.DEFAULT_NUM_CPUS,
     show_default=True,
 )
 @click.option(
     "--chunk-word-count",
     type=click.INT,
     help="Number of words to chunk the document",
-    default=config.DEFAULT_CHUNK_WORD_COUNT,
+    default=defaults.DEFAULT_CHUNK_WORD_COUNT,
     show_default=True,
 )
 @click.option(
     "--num-instructions",
     type=click.INT,
     help="Number of instructions to generate.",
-    default=config.DEFAULT_NUM_INSTRUCTIONS,
+    default=defaults.DEFAULT_NUM_INSTRUCTIONS,
     show_default=True,
 )
 @click.option(
     "--taxonomy-path",
     type=click.Path(),
-    default=config.DEFAULT_TAXONOMY_PATH,
+    default=defaults.DEFAULT_TAXONOMY_PATH,
     show_default=True,
-    help=f"Path to {config.DEFAULT_TAXONOMY_REPO} clone or local file path.",
+    help=defaults.HELP_TAXONOMY_PATH_OR_FILE,
 )
 @click.option(
     "--taxonomy-base",
-    default=config.DEFAULT_TAXONOMY_BASE,
+    default=defaults.DEFAULT_TAXONOMY_BASE,
     show_default=True,
     help="Base git-ref to use when generating new taxonomy.",
 )
 @click.option(
     "--output-dir",
     type=click.Path(),
-    default=config.DEFAULT_GENERATED_FILES_OUTPUT_DIR,
+    default=defaults.DEFAULT_GENERATED_FILES_OUTPUT_DIR,
     help="Path to output generated files.",
 )
 @click.option(
@@ -81,7 +81,7 @@ logger = logging.getLogger(__name__)
 @click.option(
     "--api-key",
     type=click.STRING,
-    default=config.DEFAULT_API_KEY,  # Note: do not expose default API key
+    default=defaults.DEFAULT_API_KEY,  # Note: do not expose default API key
     help="API key for API endpoint. [default: config.DEFAULT_API_KEY]",
 )
 @click.option(
@@ -93,7 +93,7 @@ logger = logging.getLogger(__name__)
 @click.option(
     "--server-ctx-size",
     type=click.INT,
-    default=config.MAX_CONTEXT_SIZE,
+    default=defaults.MAX_CONTEXT_SIZE,
     show_default=True,
     help="The context size is the maximum number of tokens the server will consider.",
 )
@@ -150,6 +150,8 @@ def generate(
     model_family,
 ):
     """Generates synthetic data to enhance your example data"""
+    utils.ensure_mp_start_method()
+
     # pylint: disable=C0415
     # Third Party
     from instructlab.sdg.generate_data import generate_data
@@ -158,7 +160,7 @@ def generate(
     # First Party
     from instructlab.model.backends.llama_cpp import ensure_server
 
-    prompt_file_path = config.DEFAULT_PROMPT_FILE
+    prompt_file_path = defaults.DEFAULT_PROMPT_FILE
     if ctx.obj is not None:
         prompt_file_path = ctx.obj.config.generate.prompt_file
 
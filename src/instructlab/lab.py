@@ -3,25 +3,86 @@
 # pylint: disable=too-many-lines
 
 # Standard
-import multiprocessing
+import importlib
+import sys
 
 # Third Party
 import click
 
 # First Party
-from instructlab import configuration as cfg
+from instructlab import config_defaults as defaults
 
-# Local
-# NOTE: Subcommands are using local imports to speed up startup time.
-from .config import config as config_group
-from .data import data as data_group
-from .model import model as model_group
-from .sysinfo import get_sysinfo
-from .taxonomy import taxonomy as taxonomy_group
+# NOTE: Command groups are imported on demand (see _load_group below) to speed
+# up startup time. Each group module and its subcommands only load when the
+# group is actually registered with the CLI.
 
-# 'fork' is unsafe and incompatible with some hardware accelerators.
-# Python 3.14 will switch to 'spawn' on all platforms.
-multiprocessing.set_start_method(cfg.DEFAULT_MULTIPROCESSING_START_METHOD, force=True)
+# NOTE: the multiprocessing start method is no longer forced at import time.
+# Subcommands that spawn workers call utils.ensure_mp_start_method() instead.
+
+# Command groups exposed by the CLI. The group object shares its name with the
+# submodule it lives in, e.g. instructlab.model exposes the 'model' group.
+GROUP_NAMES = ("config", "data", "model", "taxonomy")
+
+# Deprecated top-level aliases and the "<group> <command>" they map to.
+aliases = {
+    "serve": ("model", "serve"),
+    "train": ("model", "train"),
+    "convert": ("model", "convert"),
+    "chat": ("model", "chat"),
+    "test": ("model", "test"),
+    "init": ("config", "init"),
+    "download": ("model", "download"),
+    "diff": ("taxonomy", "diff"),
+    "generate": ("data", "generate"),
+}
+
+
+def _load_group(group_name):
+    """Import a command group submodule and return its click group"""
+    module = importlib.import_module(f"instructlab.{group_name}.{group_name}")
+    return getattr(module, group_name)
+
+
+def _sniff_subcommand(argv):
+    """Best-effort detection of the invoked subcommand from argv.
+
+    Returns the first token that is not a flag or a flag value, or None
+    when there is no such token. Help and version requests always return
+    None no matter where the flag appears, so that help output renders
+    against the fully-registered CLI.
+    """
+    args = argv[1:]
+    if any(arg in ("--help", "-h", "--version") for arg in args):
+        return None
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg == "--config":
+            # top-level option that takes a value
+            skip_next = True
+            continue
+        if arg.startswith("-"):
+            continue
+        return arg
+    return None
+
+
+def _groups_to_register(subcommand):
+    """Map the sniffed subcommand to the group(s) that must be registered.
+
+    Only the invoked group is registered when the subcommand is
+    unambiguous; everything is registered otherwise (e.g. for `--help`)
+    so that help output and error handling still see the full CLI.
+    """
+    if subcommand in aliases:
+        return (aliases[subcommand][0],)
+    if subcommand in GROUP_NAMES:
+        return (subcommand,)
+    if subcommand == "sysinfo":
+        return ()
+    return GROUP_NAMES
 
 
 class ExpandAliasesGroup(click.Group):
@@ -31,13 +92,12 @@ class ExpandAliasesGroup(click.Group):
 
     def get_command(self, ctx, cmd_name):
         if cmd_name in self.aliases:
-            cmd = self.aliases[cmd_name]["cmd"]
-            group = self.aliases[cmd_name]["group"].name
-            c = self.aliases[cmd_name]["cmd"].name
+            group_name, c = self.aliases[cmd_name]
+            group = self.commands.get(group_name) or _load_group(group_name)
             print(
-                f"You are using an aliased command, this will be deprecated in a future release. Please consider using `ilab {group} {c}` instead"
+                f"You are using an aliased command, this will be deprecated in a future release. Please consider using `ilab {group_name} {c}` instead"
             )
-            return cmd
+            return group.commands[c]
         cmd = click.Group.get_command(self, ctx, cmd_name)
         return cmd
 
@@ -47,35 +107,18 @@ class ExpandAliasesGroup(click.Group):
             formatter.write_paragraph()
             formatter.write_text("Aliases:")
             with formatter.indentation():
-                for alias, commands in sorted(self.aliases.items()):
-                    formatter.write_text(
-                        "{}: {} {}\n".format(
-                            alias, commands["group"].name, commands["cmd"].name
-                        )
-                    )
+                for alias, (group_name, cmd_name) in sorted(self.aliases.items()):
+                    formatter.write_text(f"{alias}: {group_name} {cmd_name}\n")
 
         super().format_epilog(ctx, formatter)
 
 
-aliases = {
-    "serve": {"group": model_group.model, "cmd": model_group.serve},
-    "train": {"group": model_group.model, "cmd": model_group.train},
-    "convert": {"group": model_group.model, "cmd": model_group.convert},
-    "chat": {"group": model_group.model, "cmd": model_group.chat},
-    "test": {"group": model_group.model, "cmd": model_group.test},
-    "init": {"group": config_group.config, "cmd": config_group.init},
-    "download": {"group": model_group.model, "cmd": model_group.download},
-    "diff": {"group": taxonomy_group.taxonomy, "cmd": taxonomy_group.diff},
-    "generate": {"group": data_group.data, "cmd": data_group.generate},
-}
-
-
 @click.group(cls=ExpandAliasesGroup, aliases=aliases)
 @click.option(
     "--config",
     "config_file",
     type=click.Path(),
-    default=cfg.DEFAULT_CONFIG,
+    default=defaults.DEFAULT_CONFIG,
     show_default=True,
     help="Path to a configuration file.",
 )
@@ -87,17 +130,27 @@ def ilab(ctx, config_file):
 
     If this is your first time running ilab, it's best to start with `ilab init` to create the environment.
     """
+    # pylint: disable=C0415
+    # First Party
+    # NOTE: the configuration module is imported lazily so `--help` does not
+    # pay for pydantic and the training libraries.
+    from instructlab import configuration as cfg
+
     cfg.init(ctx, config_file)
 
 
-ilab.add_command(model_group.model)
-ilab.add_command(taxonomy_group.taxonomy)
-ilab.add_command(data_group.data)
-ilab.add_command(config_group.config)
+for _group_name in _groups_to_register(_sniff_subcommand(sys.argv)):
+    ilab.add_command(_load_group(_group_name))
 
 
 @ilab.command
 def sysinfo():
     """Print system information"""
-    for key, value in get_sysinfo().items():
-        print(f"{key}: {value}")
+    # pylint: disable=C0415
+    # Local
+    from .sysinfo import get_cached_sysinfo
+
+    info = get_cached_sysinfo()
+    # emit in one buffered write instead of one print() per key
+    sys.stdout.write("".join(f"{key}: {value}\n" for key, value in info.items()))
+    sys.stdout.flush()
@@ -7,6 +7,18 @@ import sys
 
 FORMAT = "%(levelname)s %(asctime)s %(filename)s:%(lineno)d: %(funcName)s %(message)s"
 
+# Third-party libraries whose INFO messages are suppressed when logging is
+# configured. Setting a logger's level does not import the library.
+_THIRD_PARTY_LOGGERS = ("openai", "httpx")
+
+
+def _quiet_third_party_loggers() -> None:
+    """Raise noisy third-party loggers to ERROR, skipping no-op updates"""
+    for name in _THIRD_PARTY_LOGGERS:
+        third_party = logging.getLogger(name)
+        if third_party.level != logging.ERROR:
+            third_party.setLevel(logging.ERROR)
+
 
 class CustomFormatter(logging.Formatter):
     def format(self, record):
@@ -71,5 +83,4 @@ def configure_logging(
     root.setLevel(log_level)
 
     # Set logging level of OpenAI client and httpx library to ERROR to suppress INFO messages
-    logging.getLogger("openai").setLevel(logging.ERROR)
-    logging.getLogger("httpx").setLevel(logging.ERROR)
+    _quiet_third_party_loggers()
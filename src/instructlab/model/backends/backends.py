@@ -19,6 +19,7 @@ import uvicorn
 # Local
 from ...client import ClientException, list_models
 from ...configuration import get_api_base
+from ...utils import ensure_mp_start_method
 
 LLAMA_CPP = "llama-cpp"
 VLLM = "vllm"
@@ -205,6 +206,10 @@ def ensure_server(
 ) -> Tuple[multiprocessing.Process, str]:
     """Checks if server is running, if not starts one as a subprocess. Returns the server process
     and the URL where it's available."""
+    # the server is started via multiprocessing, so make sure the start
+    # method is "spawn" before any process is created; every command that
+    # auto-starts a backend funnels through here
+    ensure_mp_start_method()
 
     try:
         logger.debug(f"Trying to connect to {api_base}...")
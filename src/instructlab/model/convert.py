@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # Standard
-from glob import glob
 from pathlib import Path
 import logging
 import os
@@ -104,7 +103,7 @@ def convert(ctx, model_dir, adapter_file, skip_de_quantize, skip_quantize, model
     )
 
     logger.info(f"deleting safetensors files from {model_dir_fused_pt}...")
-    for file in glob(os.path.join(model_dir_fused_pt, "*.safetensors")):
+    for file in Path(model_dir_fused_pt).glob("*.safetensors"):
         os.remove(file)
 
     # quantize to 4-bit GGUF (optional)
@@ -5,16 +5,32 @@ from os.path import basename, dirname
 import os
 
 # Third Party
-from huggingface_hub import hf_hub_download, list_repo_files
-from huggingface_hub import logging as hf_logging
-from huggingface_hub import snapshot_download
 import click
 
 # First Party
-from instructlab import configuration as config
+from instructlab import config_defaults as defaults
 from instructlab import utils
 
 
+def _enable_hf_transfer():
+    """Use the Rust hf_transfer downloader when the package is installed.
+
+    hf_transfer downloads in parallel chunks and is significantly faster
+    on large safetensors repositories. huggingface_hub reads the setting
+    at import time, so this must run before it is imported. An explicit
+    HF_HUB_ENABLE_HF_TRANSFER from the user always wins.
+    """
+    if "HF_HUB_ENABLE_HF_TRANSFER" in os.environ:
+        return
+    try:
+        # pylint: disable=C0415,unused-import
+        # Third Party
+        import hf_transfer  # noqa: F401
+    except ImportError:
+        return
+    os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
+
+
 @click.command()
 @click.option(
     "--repository",
@@ -30,13 +46,13 @@ from instructlab import utils
 )
 @click.option(
     "--filename",
-    default=basename(config.DEFAULT_MODEL_PATH),
+    default=basename(defaults.DEFAULT_MODEL_PATH),
     show_default=True,
     help="Name of the model file to download from the Hugging Face repository.",
 )
 @click.option(
     "--model-dir",
-    default=dirname(config.DEFAULT_MODEL_PATH),
+    default=dirname(defaults.DEFAULT_MODEL_PATH),
     show_default=True,
     help="The local directory to download the model files into.",
 )
@@ -50,6 +66,15 @@ from instructlab import utils
 @utils.display_params
 def download(ctx, repository, release, filename, model_dir, hf_token):
     """Download the model(s) to train"""
+    _enable_hf_transfer()
+
+    # pylint: disable=C0415
+    # Third Party
+    # NOTE: huggingface_hub is imported lazily to speed up CLI startup time.
+    from huggingface_hub import hf_hub_download, list_repo_files
+    from huggingface_hub import logging as hf_logging
+    from huggingface_hub import snapshot_download
+
     click.echo(f"Downloading model from {repository}@{release} to {model_dir}...")
     if hf_token == "" and "instructlab" not in repository:
         raise ValueError(
@@ -8,7 +8,7 @@ import pathlib
 import click
 
 # First Party
-from instructlab import configuration as config
+from instructlab import config_defaults as defaults
 from instructlab import log, utils
 from instructlab.model.backends.llama_cpp import ServerException, server
 
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 @click.option(
     "--model-path",
     type=click.Path(),
-    default=config.DEFAULT_MODEL_PATH,
+    default=defaults.DEFAULT_MODEL_PATH,
     show_default=True,
     help="Path to the model used during generation.",
 )
@@ -66,6 +66,7 @@ def serve(
     backend,
 ):
     """Start a local server"""
+    utils.ensure_mp_start_method()
 
     # First Party
     from instructlab.model.backends import llama_cpp, vllm
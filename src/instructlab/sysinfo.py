@@ -1,11 +1,24 @@
 # SPDX-License-Identifier: Apache-2.0
 # Standard
 import importlib.metadata
+import json
 import os
 import platform
 import sys
+import time
 import typing
 
+try:
+    # Third Party
+    # optional accelerated JSON codec for the on-disk cache
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Probing the hardware (torch, CUDA, HPU) dominates the run time of
+# `ilab sysinfo`, so results are cached on disk for a short while.
+_CACHE_TTL = 3600  # seconds
+
 
 def _platform_info() -> typing.Dict[str, typing.Any]:
     """Platform and machine information"""
@@ -117,22 +130,86 @@ def _llama_cpp_info() -> typing.Dict[str, typing.Any]:
     }
 
 
-def get_sysinfo() -> typing.Dict[str, typing.Any]:
-    """Get system information"""
+def _stable_sysinfo() -> typing.Dict[str, typing.Any]:
+    """System information that only changes with an install or host change"""
     info = {
         "instructlab.version": importlib.metadata.version("instructlab"),
     }
     info.update(_platform_info())
     info.update(_torch_info())
+    info.update(_llama_cpp_info())
+    return info
+
+
+def _volatile_sysinfo() -> typing.Dict[str, typing.Any]:
+    """Device state that changes between runs.
+
+    The CUDA probe reports free VRAM and the HPU probe reports accelerator
+    environment variables; both must reflect the current state of the host,
+    so they are never served from the cache.
+    """
+    info: typing.Dict[str, typing.Any] = {}
     info.update(_torch_cuda_info())
     info.update(_torch_hpu_info())
-    info.update(_llama_cpp_info())
+    return info
+
+
+def get_sysinfo() -> typing.Dict[str, typing.Any]:
+    """Get system information"""
+    info = _stable_sysinfo()
+    info.update(_volatile_sysinfo())
+    return info
+
+
+def _cache_file() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(cache_home, "instructlab", "sysinfo.json")
+
+
+def get_cached_sysinfo() -> typing.Dict[str, typing.Any]:
+    """Get system information, cached on disk for up to an hour.
+
+    The cache is keyed on a cheap OS fingerprint so that a changed kernel
+    or host invalidates it immediately. Only stable readings are cached;
+    volatile ones (see _volatile_sysinfo) are probed on every call. Caching
+    is best effort; any stale, corrupt, or unwritable cache falls back to a
+    fresh probe.
+    """
+    fingerprint = platform.node() + platform.release()
+    cache_file = _cache_file()
+    try:
+        if time.time() - os.path.getmtime(cache_file) < _CACHE_TTL:
+            with open(cache_file, "rb", buffering=65536) as f:
+                cached = (orjson or json).loads(f.read())
+            if cached.get("fingerprint") == fingerprint:
+                info = cached["sysinfo"]
+                info.update(_volatile_sysinfo())
+                return info
+    except (OSError, ValueError, KeyError):
+        pass
+
+    stable = _stable_sysinfo()
+    payload = {"fingerprint": fingerprint, "sysinfo": stable}
+    try:
+        if orjson is not None:
+            encoded = orjson.dumps(payload, default=str)
+        else:
+            encoded = json.dumps(payload, default=str).encode("utf-8")
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "wb") as f:
+            f.write(encoded)
+    except (OSError, TypeError, ValueError):
+        pass
+    info = stable
+    info.update(_volatile_sysinfo())
     return info
 
 
 def main():
-    for key, value in get_sysinfo().items():
-        print(f"{key}: {value}")
+    sys.stdout.write(
+        "".join(f"{key}: {value}\n" for key, value in get_sysinfo().items())
+    )
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
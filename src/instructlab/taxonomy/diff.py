@@ -1,26 +1,21 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # Standard
-import logging
 import os
 
 # Third Party
-from git import GitError
 import click
-import yaml
 
 # First Party
-from instructlab import configuration as config
+from instructlab import config_defaults as defaults
 from instructlab import utils
 
-logger = logging.getLogger(__name__)
-
 
 @click.command()
 @click.option(
     "--taxonomy-path",
     type=click.Path(),
-    help=f"Path to {config.DEFAULT_TAXONOMY_REPO} clone or local file path.",
+    help=defaults.HELP_TAXONOMY_PATH_OR_FILE,
 )
 @click.option(
     "--taxonomy-base",
@@ -45,6 +40,11 @@ def diff(ctx, taxonomy_path, taxonomy_base, yaml_rules, quiet):
     and checks that taxonomy is valid. Similar to 'git diff <ref>'.
     """
     # pylint: disable=C0415
+    # Third Party
+    # NOTE: GitPython and PyYAML are imported lazily to speed up CLI startup time.
+    from git import GitError
+    import yaml
+
     # Local
     from ..utils import get_taxonomy_diff, read_taxonomy
 
@@ -66,8 +66,9 @@ def diff(ctx, taxonomy_path, taxonomy_base, yaml_rules, quiet):
                     fg="red",
                 )
                 raise SystemExit(1) from exc
-            for f in updated_taxonomy_files:
-                click.echo(f)
+            if updated_taxonomy_files:
+                # one buffered write instead of one echo per file
+                click.echo("\n".join(updated_taxonomy_files))
     try:
         read_taxonomy(None, taxonomy_path, taxonomy_base, yaml_rules)
     except (SystemExit, yaml.YAMLError) as exc:
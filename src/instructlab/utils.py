@@ -5,9 +5,10 @@ from functools import cache, wraps
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional, Union
 import copy
-import glob
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import platform
 import re
@@ -25,6 +26,7 @@ import yaml
 
 # Local
 from . import common
+from . import config_defaults as defaults
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,10 @@ rules:
 
 DEFAULT_CHUNK_OVERLAP = 100
 
+# Prefer the libyaml-backed loader when available; it parses several times
+# faster than the pure-Python SafeLoader and accepts the same documents.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class TaxonomyReadingException(Exception):
     """An exception raised during reading of the taxonomy."""
@@ -81,6 +87,19 @@ def is_macos_with_m_chip():
         return False
 
 
+def ensure_mp_start_method():
+    """Force the default multiprocessing start method if it is not set yet.
+
+    'fork' is unsafe and incompatible with some hardware accelerators.
+    Python 3.14 will switch to 'spawn' on all platforms. Only subcommands
+    that spawn workers need to call this, so `--help` and trivial commands
+    do not touch the multiprocessing singleton at all.
+    """
+    desired = defaults.DEFAULT_MULTIPROCESSING_START_METHOD
+    if multiprocessing.get_start_method(allow_none=True) != desired:
+        multiprocessing.set_start_method(desired, force=True)
+
+
 def expand_path(path):
     """Expands ~ and environment variables from the given path"""
     path = os.path.expanduser(path)
@@ -132,10 +151,10 @@ TAXONOMY_FOLDERS: List[str] = ["compositional_skills", "knowledge"]
 
 
 def istaxonomyfile(fn):
-    path = Path(fn)
-    if path.suffix == ".yaml" and path.parts[0] in TAXONOMY_FOLDERS:
-        return True
-    return False
+    # hot path: called for every untracked/changed file in the taxonomy
+    # repo, so use plain string operations instead of constructing a Path.
+    # git always reports forward-slash separated relative paths.
+    return fn.endswith(".yaml") and fn.split("/", 1)[0] in TAXONOMY_FOLDERS
 
 
 def get_taxonomy_diff(repo="taxonomy", base="origin/main"):
@@ -213,11 +232,13 @@ def get_documents(
             file_contents = []
 
             logger.debug("Processing files...")
+            # Path.glob is a generator, so matches stream instead of being
+            # collected into an intermediate list per pattern
+            work_dir = Path(repo.working_dir)
             for pattern in file_patterns:
-                for file_path in glob.glob(os.path.join(repo.working_dir, pattern)):
-                    if os.path.isfile(file_path) and file_path.endswith(".md"):
-                        with open(file_path, "r", encoding="utf-8") as file:
-                            file_contents.append(file.read())
+                for file_path in work_dir.glob(pattern):
+                    if file_path.suffix == ".md" and file_path.is_file():
+                        file_contents.append(file_path.read_text(encoding="utf-8"))
 
             if file_contents:
                 return file_contents
@@ -439,6 +460,48 @@ def get_version(contents: Mapping) -> int:
     return version
 
 
+def _taxonomy_cache_file(file_path: Path) -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    digest = hashlib.sha256(str(file_path).encode("utf-8")).hexdigest()
+    return os.path.join(cache_home, "instructlab", "taxonomy", f"{digest}.json")
+
+
+def _load_taxonomy_yaml(file_path: Path):
+    """Parse a taxonomy YAML document, amortized by an on-disk JSON cache.
+
+    Parsing YAML is much slower than loading JSON, and taxonomy files are
+    re-read on every `ilab diff`/`ilab generate` run. The parsed document
+    is cached keyed on the file's size and mtime; any cache problem falls
+    back to parsing the YAML.
+    """
+    cache_file = _taxonomy_cache_file(file_path)
+    stat = os.stat(file_path)
+    try:
+        with open(cache_file, "rb", buffering=65536) as f:
+            cached = json.load(f)
+        if cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+            return cached["contents"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    with open(file_path, "r", encoding="utf-8", buffering=65536) as file:
+        contents = yaml.load(file, Loader=_SafeLoader)
+    try:
+        encoded = json.dumps(
+            {"mtime": stat.st_mtime, "size": stat.st_size, "contents": contents}
+        )
+        # only cache documents that survive the JSON round trip unchanged
+        # (YAML allows types such as dates and non-string keys that JSON
+        # would silently coerce)
+        if json.loads(encoded)["contents"] == contents:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                f.write(encoded)
+    except (OSError, TypeError, ValueError):
+        pass
+    return contents
+
+
 # pylint: disable=broad-exception-caught
 def read_taxonomy_file(file_path: str, yaml_rules: Optional[str] = None):
     seed_instruction_data = []
@@ -460,8 +523,7 @@ def read_taxonomy_file(file_path: str, yaml_rules: Optional[str] = None):
         taxonomy_path = file_path
     # read file if extension is correct
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            contents = yaml.safe_load(file)
+        contents = _load_taxonomy_yaml(file_path)
         if not contents:
             logger.warning(f"Skipping {file_path} because it is empty!")
             warnings += 1
@@ -580,9 +642,9 @@ def read_taxonomy(_logger, taxonomy, taxonomy_base, yaml_rules):
             logger.debug("Found new taxonomy files:")
             for e in updated_taxonomy_files:
                 logger.debug(f"* {e}")
-        for f in updated_taxonomy_files:
-            file_path = os.path.join(taxonomy, f)
-            data, warnings, errors = read_taxonomy_file(file_path, yaml_rules)
+        file_paths = [os.path.join(taxonomy, f) for f in updated_taxonomy_files]
+        results = [read_taxonomy_file(fp, yaml_rules) for fp in file_paths]
+        for data, warnings, errors in results:
             total_warnings += warnings
             total_errors += errors
             if data:
@@ -11,6 +11,17 @@ import pytest
 from .taxonomy import MockTaxonomy
 
 
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Isolate the on-disk caches from the developer's real ~/.cache
+
+    The taxonomy parse cache and the sysinfo cache both honor
+    XDG_CACHE_HOME; point it at a per-test directory so test runs never
+    write outside tmp_path.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 @pytest.fixture
 def taxonomy_dir(tmp_path):
     with MockTaxonomy(tmp_path) as taxonomy:
@@ -12,11 +12,11 @@ from instructlab import lab
 
 
 class TestLabDownload:
-    # When using `from X import Y` you need to understand that Y becomes part
-    # of your module, so you should use `my_module.Y`` to patch.
-    # When using `import X`, you should use `X.Y` to patch.
+    # `download` imports huggingface_hub lazily inside the command body, so the
+    # name is looked up on the `huggingface_hub` module at call time and must
+    # be patched there.
     # https://docs.python.org/3/library/unittest.mock.html#where-to-patch?
-    @patch("instructlab.model.download.hf_hub_download")
+    @patch("huggingface_hub.hf_hub_download")
     def test_download(self, mock_hf_hub_download):
         runner = CliRunner()
         with runner.isolated_filesystem():
@@ -34,7 +34,7 @@ class TestLabDownload:
             mock_hf_hub_download.assert_called_once()
 
     @patch(
-        "instructlab.model.download.hf_hub_download",
+        "huggingface_hub.hf_hub_download",
         MagicMock(side_effect=HfHubHTTPError("Could not reach hugging face server")),
     )
     def test_download_error(self):
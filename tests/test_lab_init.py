@@ -2,12 +2,12 @@
 # pylint: disable=duplicate-code
 
 # Standard
+from subprocess import CalledProcessError
 from unittest.mock import MagicMock, patch
 import os
 
 # Third Party
 from click.testing import CliRunner
-from git import GitError
 
 # First Party
 from instructlab import lab
@@ -15,18 +15,16 @@ from instructlab.configuration import read_config
 
 
 class TestLabInit:
-    # When using `from X import Y` you need to understand that Y becomes part
-    # of your module, so you should use `my_module.Y`` to patch.
-    # When using `import X`, you should use `X.Y` to patch.
-    # https://docs.python.org/3/library/unittest.mock.html#where-to-patch?
-    @patch("instructlab.config.init.Repo.clone_from")
-    def test_init_noninteractive(self, mock_clone_from):
+    # `init` clones the taxonomy repo by invoking the git binary, so the
+    # subprocess call is what gets mocked.
+    @patch("instructlab.config.init.subprocess.run")
+    def test_init_noninteractive(self, mock_run):
         runner = CliRunner()
         with runner.isolated_filesystem():
             result = runner.invoke(lab.ilab, ["init", "--non-interactive"])
             assert result.exit_code == 0
             assert "config.yaml" in os.listdir()
-            mock_clone_from.assert_called_once()
+            mock_run.assert_called_once()
 
     def test_init_interactive(self):
         runner = CliRunner()
@@ -36,8 +34,12 @@ class TestLabInit:
             assert "config.yaml" in os.listdir()
 
     @patch(
-        "instructlab.config.init.Repo.clone_from",
-        MagicMock(side_effect=GitError("Authentication failed")),
+        "instructlab.config.init.subprocess.run",
+        MagicMock(
+            side_effect=CalledProcessError(
+                128, "git clone", stderr="Authentication failed"
+            )
+        ),
     )
     def test_init_interactive_git_error(self):
         runner = CliRunner()
@@ -51,14 +53,14 @@ class TestLabInit:
             )
             assert "manually run" in result.output
 
-    @patch("instructlab.config.init.Repo.clone_from")
-    def test_init_interactive_clone(self, mock_clone_from):
+    @patch("instructlab.config.init.subprocess.run")
+    def test_init_interactive_clone(self, mock_run):
         runner = CliRunner()
         with runner.isolated_filesystem():
             result = runner.invoke(lab.ilab, ["init"], input="\ny")
             assert result.exit_code == 0
             assert "config.yaml" in os.listdir()
-            mock_clone_from.assert_called_once()
+            mock_run.assert_called_once()
 
     def test_init_interactive_with_preexisting_nonempty_taxonomy(self):
         runner = CliRunner()
@@ -1,7 +1,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # Standard
+from pathlib import Path
 from unittest.mock import Mock, patch
+import datetime
+import os
 
 # Third Party
 import git
@@ -56,6 +59,42 @@ class TestUtils:
         for chunk in chunks:
             assert len(chunk) <= max_chars
 
+    def test_taxonomy_yaml_cache_hit(self, tmp_path):
+        taxonomy_file = tmp_path / "qna.yaml"
+        taxonomy_file.write_text("version: 2\ncreated_by: ci\n", encoding="utf-8")
+        contents = utils._load_taxonomy_yaml(taxonomy_file)
+        assert contents == {"version": 2, "created_by": "ci"}
+        assert Path(utils._taxonomy_cache_file(taxonomy_file)).is_file()
+        # a second read with an unchanged file must come from the cache
+        with patch("instructlab.utils.yaml.load") as mock_load:
+            assert utils._load_taxonomy_yaml(taxonomy_file) == contents
+            mock_load.assert_not_called()
+
+    def test_taxonomy_yaml_cache_invalidation(self, tmp_path):
+        taxonomy_file = tmp_path / "qna.yaml"
+        taxonomy_file.write_text("version: 2\n", encoding="utf-8")
+        assert utils._load_taxonomy_yaml(taxonomy_file) == {"version": 2}
+        # same size, different mtime: the cached document must be discarded
+        taxonomy_file.write_text("version: 3\n", encoding="utf-8")
+        stat = os.stat(taxonomy_file)
+        os.utime(taxonomy_file, (stat.st_atime, stat.st_mtime + 10))
+        assert utils._load_taxonomy_yaml(taxonomy_file) == {"version": 3}
+        # different size: likewise
+        taxonomy_file.write_text("version: 3\ncreated_by: ci\n", encoding="utf-8")
+        assert utils._load_taxonomy_yaml(taxonomy_file) == {
+            "version": 3,
+            "created_by": "ci",
+        }
+
+    def test_taxonomy_yaml_cache_rejects_non_json_documents(self, tmp_path):
+        # YAML dates do not survive a JSON round trip, so the document must
+        # be returned as parsed but never cached
+        taxonomy_file = tmp_path / "qna.yaml"
+        taxonomy_file.write_text("version: 2\ncreated: 2024-01-01\n", encoding="utf-8")
+        contents = utils._load_taxonomy_yaml(taxonomy_file)
+        assert contents["created"] == datetime.date(2024, 1, 1)
+        assert not Path(utils._taxonomy_cache_file(taxonomy_file)).exists()
+
     @patch(
         "instructlab.utils.git_clone_checkout",
         return_value=Mock(spec=git.Repo, working_dir="tests/testdata/temp_repo"),